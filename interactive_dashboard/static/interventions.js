@@ -41,6 +41,10 @@
     const crisisSelect = document.getElementById('crisisFilter');
     let chainModalElement = null;
     let chainModalInstance = null;
+    let loadedSessions = [];
+    let nextCursor = null;
+    let activeParams = null;
+    let interventionsRequestId = 0;
 
     document.addEventListener('DOMContentLoaded', () => {
         fetchFilters();
@@ -173,6 +177,9 @@
             input.checked = false;
         });
         updateAllFilterLabels();
+        interventionsRequestId++;
+        loadedSessions = [];
+        nextCursor = null;
         interventionsContainer.innerHTML = '<p class="text-muted mb-0">Use the filters above and click Apply to load matching sessions.</p>';
         resultsCounter.textContent = 'No sessions loaded';
     }
@@ -189,8 +196,25 @@
         return params;
     }
 
+    function fetchInterventionsPage(params, cursor) {
+        const pageParams = new URLSearchParams(params);
+        if (cursor) {
+            Object.entries(cursor).forEach(([key, value]) => pageParams.set(key, value));
+        }
+        return fetch(`/api/interventions?${pageParams.toString()}`)
+            .then(response => response.json())
+            .then(data => ({
+                rows: Array.isArray(data && data.rows) ? data.rows : [],
+                nextCursor: (data && data.next_cursor) || null
+            }));
+    }
+
     function loadInterventions() {
         const params = buildFilterParams();
+        const requestId = ++interventionsRequestId;
+        activeParams = params;
+        loadedSessions = [];
+        nextCursor = null;
         interventionsContainer.innerHTML = `
             <div class="text-center py-4">
                 <div class="spinner-border text-primary" role="status"></div>
@@ -199,10 +223,14 @@
         `;
     resultsCounter.textContent = 'Loading...';
 
-        fetch(`/api/interventions?${params.toString()}`)
-            .then(response => response.json())
-            .then(data => {
-                renderInterventions(Array.isArray(data) ? data : []);
+        fetchInterventionsPage(params)
+            .then(page => {
+                if (requestId !== interventionsRequestId) {
+                    return;
+                }
+                loadedSessions = page.rows;
+                nextCursor = page.nextCursor;
+                renderInterventions(loadedSessions);
             })
             .catch(error => {
                 console.error('Failed to load interventions', error);
@@ -211,6 +239,33 @@
             });
     }
 
+    function loadMoreInterventions(button) {
+        if (!nextCursor) {
+            return;
+        }
+        const requestId = interventionsRequestId;
+        button.disabled = true;
+        button.textContent = 'Loading...';
+
+        fetchInterventionsPage(activeParams, nextCursor)
+            .then(page => {
+                if (requestId !== interventionsRequestId) {
+                    return;
+                }
+                const accordion = document.getElementById('interventionsAccordion');
+                accordion.insertAdjacentHTML('beforeend', page.rows.map(createAccordionItem).join(''));
+                bindDetailLoaders(accordion);
+                loadedSessions = loadedSessions.concat(page.rows);
+                nextCursor = page.nextCursor;
+                updateResultsFooter();
+            })
+            .catch(error => {
+                console.error('Failed to load more interventions', error);
+                button.disabled = false;
+                button.textContent = 'Retry loading more sessions';
+            });
+    }
+
     function renderInterventions(sessions) {
         if (!sessions.length) {
             interventionsContainer.innerHTML = '<p class="text-muted mb-0">No sessions match the selected filters.</p>';
@@ -223,11 +278,33 @@
             html += createAccordionItem(session);
         });
         html += '</div>';
+        html += '<div class="text-center mt-3" id="interventionsLoadMore"></div>';
 
         interventionsContainer.innerHTML = html;
-        resultsCounter.textContent = `${sessions.length} session${sessions.length > 1 ? 's' : ''}`;
+        bindDetailLoaders(interventionsContainer);
+        updateResultsFooter();
+    }
+
+    function updateResultsFooter() {
+        const count = loadedSessions.length;
+        resultsCounter.textContent = `${count} session${count > 1 ? 's' : ''}${nextCursor ? ' (more available)' : ''}`;
+
+        const footer = document.getElementById('interventionsLoadMore');
+        if (!footer) {
+            return;
+        }
+        footer.innerHTML = nextCursor
+            ? '<button type="button" class="btn btn-outline-primary btn-sm">Load more sessions</button>'
+            : '';
+        const button = footer.querySelector('button');
+        if (button) {
+            button.addEventListener('click', () => loadMoreInterventions(button));
+        }
+    }
 
-        document.querySelectorAll('.intervention-collapse').forEach(collapseEl => {
+    function bindDetailLoaders(root) {
+        root.querySelectorAll('.intervention-collapse:not([data-detail-bound])').forEach(collapseEl => {
+            collapseEl.dataset.detailBound = 'true';
             collapseEl.addEventListener('show.bs.collapse', () => {
                 const detailContainer = collapseEl.querySelector('.intervention-detail');
                 if (!detailContainer || detailContainer.dataset.loaded === 'true') {
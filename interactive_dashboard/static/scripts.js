@@ -1558,6 +1558,31 @@ document.addEventListener('DOMContentLoaded', function() {
         setTimeout(updateDashboard, 300);
     }
 
+    // Dashboard-load panels come from one /api/dashboard-bundle request, which filters sessions once server-side
+    function fetchDashboardBundle(query) {
+        return fetch(`/api/dashboard-bundle?${query}`)
+            .then(res => res.json()) // A failed bundle still carries every part that succeeded
+            .catch(error => {
+                console.error('Error fetching dashboard bundle:', error);
+                return {};
+            });
+    }
+
+    function loadDashboardPart(bundle, key, url, errorMessage) {
+        return bundle.then(parts => {
+            if (parts && parts[key] != null) {
+                return parts[key];
+            }
+            // Parts missing from the bundle are retried on their own endpoint
+            return fetch(url).then(res => {
+                if (!res.ok) {
+                    throw new Error(errorMessage);
+                }
+                return res.json();
+            });
+        });
+    }
+
     // --- DASHBOARD UPDATE LOGIC ---
     function updateDashboard() {
         startLoadingCycle();
@@ -1568,7 +1593,8 @@ document.addEventListener('DOMContentLoaded', function() {
         resetNeqCaches();
         renderNeqUnifiedChart();
 
-        updateDashboardSummary(query);
+        const bundle = fetchDashboardBundle(query);
+        updateDashboardSummary(query, bundle);
         updateCrisisData(query);
         updateActionPlanChart(query);
         updateOverallAdherenceChart(query);
@@ -1576,12 +1602,12 @@ document.addEventListener('DOMContentLoaded', function() {
         updateTherapistNeqChart(query);
         updateNeqAggregateChartData(query);
         updateNeqSessionTrends(query);
-        updateNeqQuestionTable(query);
-        updateTherapistSureChart(query);
-        updateTherapistWaiChart(query);
+        updateNeqQuestionTable(query, bundle);
+        updateTherapistSureChart(query, bundle);
+        updateTherapistWaiChart(query, bundle);
         updateMiGlobalProfileChart(query);
-        updateMiGlobalMetrics(query);
-        updateMiBehaviorMetrics(query);
+        updateMiGlobalMetrics(query, bundle);
+        updateMiBehaviorMetrics(query, bundle);
         updateSrsComponentTrends(query);
         updateWaiComponentTrends(query);
         updateAdverseOutcomesChart(query);
@@ -1591,7 +1617,7 @@ document.addEventListener('DOMContentLoaded', function() {
         updateScoreTrends(query);
         updateSureSessionTrends(query);
         updateSureDomainTrendData(query);
-        updateSureDomainAggregateChartData(query);
+        updateSureDomainAggregateChartData(query, bundle);
         updatePatientTypeComparisons(query);
         updateEquityAudit(params);
     }
@@ -1669,15 +1695,9 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateDashboardSummary(query) {
+    function updateDashboardSummary(query, bundle) {
         beginLoading();
-        fetch(`/api/dashboard-summary?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load dashboard summary');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'dashboard_summary', `/api/dashboard-summary?${query}`, 'Failed to load dashboard summary')
             .then(data => {
                 if (!data) return;
                 const { therapists, personas, sessions, patient_turns, therapist_turns, dialogue_turns } = data;
@@ -2273,19 +2293,13 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateNeqQuestionTable(query) {
+    function updateNeqQuestionTable(query, bundle) {
         if (!neqTableBody) {
             return;
         }
 
         beginLoading();
-        fetch(`/api/neq-question-summary?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load NEQ question summary');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'neq_question_summary', `/api/neq-question-summary?${query}`, 'Failed to load NEQ question summary')
             .then(data => {
                 neqTableBody.innerHTML = '';
 
@@ -2412,15 +2426,9 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateTherapistSureChart(query) {
+    function updateTherapistSureChart(query, bundle) {
         beginLoading();
-        fetch(`/api/therapist-comparison-sure?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load SURE comparison data');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'therapist_comparison_sure', `/api/therapist-comparison-sure?${query}`, 'Failed to load SURE comparison data')
             .then(apiData => {
                 const toNumberOrNull = value => {
                     if (value === null || value === undefined) {
@@ -2449,15 +2457,9 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateTherapistWaiChart(query) {
+    function updateTherapistWaiChart(query, bundle) {
         beginLoading();
-        fetch(`/api/therapist-comparison-wai?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load WAI comparison data');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'therapist_comparison_wai', `/api/therapist-comparison-wai?${query}`, 'Failed to load WAI comparison data')
             .then(apiData => {
                 const filteredData = (apiData || []).filter(d => d.therapist_id !== 'therapist_psych_material');
                 const rawLabels = filteredData.map(d => getTherapistDisplayName(d.therapist_id));
@@ -3434,15 +3436,9 @@ document.addEventListener('DOMContentLoaded', function() {
         });
     }
 
-    function updateSureDomainAggregateChartData(query) {
+    function updateSureDomainAggregateChartData(query, bundle) {
         beginLoading();
-        fetch(`/api/sure-domain-aggregates?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load SURE domain aggregates');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'sure_domain_aggregates', `/api/sure-domain-aggregates?${query}`, 'Failed to load SURE domain aggregates')
             .then(apiData => {
                 const therapistRecords = apiData && Array.isArray(apiData.therapist) ? apiData.therapist : [];
                 const patientRecords = apiData && Array.isArray(apiData.patient) ? apiData.patient : [];
@@ -4183,15 +4179,9 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateMiGlobalMetrics(query) {
+    function updateMiGlobalMetrics(query, bundle) {
         beginLoading();
-        fetch(`/api/mi-global-metrics?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load MI global metrics');
-                }
-                return res.json();
-            }).then(apiData => {
+        loadDashboardPart(bundle, 'mi_global_metrics', `/api/mi-global-metrics?${query}`, 'Failed to load MI global metrics').then(apiData => {
                 const rows = Array.isArray(apiData) ? apiData : [];
 
                 const labels = [];
@@ -4314,15 +4304,9 @@ document.addEventListener('DOMContentLoaded', function() {
             .finally(() => endLoading());
     }
 
-    function updateMiBehaviorMetrics(query) {
+    function updateMiBehaviorMetrics(query, bundle) {
         beginLoading();
-        fetch(`/api/mi-behavior-metrics?${query}`)
-            .then(res => {
-                if (!res.ok) {
-                    throw new Error('Failed to load MI behavior metrics');
-                }
-                return res.json();
-            })
+        loadDashboardPart(bundle, 'mi_behavior_metrics', `/api/mi-behavior-metrics?${query}`, 'Failed to load MI behavior metrics')
             .then(apiData => {
                 const rows = Array.isArray(apiData) ? apiData : [];
 
@@ -26,7 +26,12 @@ ensure_table() {
     local clustering=$4
 
     if bq show --format=none "$PROJECT_ID:$DATASET.$table_name" >/dev/null 2>&1; then
-        echo "Table $table_name already exists; preserving partitioning and clustering"
+        echo "Table $table_name already exists; preserving partitioning"
+        # Clustering can change in place; BigQuery applies the new spec to data written from now on
+        if [ -n "$clustering" ]; then
+            bq update --clustering_fields="$clustering" "$PROJECT_ID:$DATASET.$table_name" >/dev/null \
+                && echo "  Clustering by: $clustering"
+        fi
         return 0
     fi
 
@@ -154,64 +159,237 @@ echo "========================================"
 
 load_table "crisis_eval_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,turn:INTEGER,reasoning:STRING,classification:STRING" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "survey_wai_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,question1:STRING,question2:STRING,question3:STRING,question4:STRING,question5:STRING,question6:STRING,question7:STRING,question8:STRING,question9:STRING,question10:STRING,question11:STRING,question12:STRING,question13:STRING,question14:STRING,question15:STRING,question16:STRING,question17:STRING,question18:STRING,question19:STRING,question20:STRING,question21:STRING,question22:STRING,question23:STRING,question24:STRING,question25:STRING,question26:STRING,question27:STRING,question28:STRING,question29:STRING,question30:STRING,question31:STRING,question32:STRING,question33:STRING,question34:STRING,question35:STRING,question36:STRING,total_wai_task:INTEGER,total_wai_bond:INTEGER,total_wai_goal:INTEGER,composite_wai:INTEGER" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "survey_sure_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,sec_a_question_1:STRING,sec_a_question_2:STRING,sec_a_question_3:STRING,sec_a_question_4:STRING,sec_a_question_5:STRING,sec_a_question_6:STRING,sec_b_question_7:STRING,sec_b_question_8:STRING,sec_b_question_9:STRING,sec_b_question_10:STRING,sec_b_question_11:STRING,sec_b_question_12:STRING,sec_b_question_13:STRING,sec_b_question_14:STRING,sec_b_question_15:STRING,sec_b_question_16:STRING,sec_b_question_17:STRING,sec_b_question_18:STRING,sec_b_question_19:STRING,sec_b_question_20:STRING,sec_b_question_21:STRING,sec_c_question_1:STRING,sec_c_question_2:STRING,sec_c_question_3:STRING,sec_c_question_4:STRING,sec_c_question_5:STRING,total_sure_drug_use:INTEGER,total_sure_self_care:INTEGER,total_sure_relationships:INTEGER,total_sure_material_resources:INTEGER,total_sure_outlook:INTEGER,total_sure_score:INTEGER" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "survey_srs_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,relationship:FLOAT,goals_and_topics:FLOAT,approach_or_method:FLOAT,overall:FLOAT" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "survey_neq_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,question1_experienced:BOOLEAN,question1_severity:STRING,question1_cause:STRING,question2_experienced:BOOLEAN,question2_severity:STRING,question2_cause:STRING,question3_experienced:BOOLEAN,question3_severity:STRING,question3_cause:STRING,question4_experienced:BOOLEAN,question4_severity:STRING,question4_cause:STRING,question5_experienced:BOOLEAN,question5_severity:STRING,question5_cause:STRING,question6_experienced:BOOLEAN,question6_severity:STRING,question6_cause:STRING,question7_experienced:BOOLEAN,question7_severity:STRING,question7_cause:STRING,question8_experienced:BOOLEAN,question8_severity:STRING,question8_cause:STRING,question9_experienced:BOOLEAN,question9_severity:STRING,question9_cause:STRING,question10_experienced:BOOLEAN,question10_severity:STRING,question10_cause:STRING,question11_experienced:BOOLEAN,question11_severity:STRING,question11_cause:STRING,question12_experienced:BOOLEAN,question12_severity:STRING,question12_cause:STRING,question13_experienced:BOOLEAN,question13_severity:STRING,question13_cause:STRING,question14_experienced:BOOLEAN,question14_severity:STRING,question14_cause:STRING,question15_experienced:BOOLEAN,question15_severity:STRING,question15_cause:STRING,question16_experienced:BOOLEAN,question16_severity:STRING,question16_cause:STRING,question17_experienced:BOOLEAN,question17_severity:STRING,question17_cause:STRING,question18_experienced:BOOLEAN,question18_severity:STRING,question18_cause:STRING,question19_experienced:BOOLEAN,question19_severity:STRING,question19_cause:STRING,question20_experienced:BOOLEAN,question20_severity:STRING,question20_cause:STRING,question21_experienced:BOOLEAN,question21_severity:STRING,question21_cause:STRING,question22_experienced:BOOLEAN,question22_severity:STRING,question22_cause:STRING,question23_experienced:BOOLEAN,question23_severity:STRING,question23_cause:STRING,question24_experienced:BOOLEAN,question24_severity:STRING,question24_cause:STRING,question25_experienced:BOOLEAN,question25_severity:STRING,question25_cause:STRING,question26_experienced:BOOLEAN,question26_severity:STRING,question26_cause:STRING,question27_experienced:BOOLEAN,question27_severity:STRING,question27_cause:STRING,question28_experienced:BOOLEAN,question28_severity:STRING,question28_cause:STRING,question29_experienced:BOOLEAN,question29_severity:STRING,question29_cause:STRING,question30_experienced:BOOLEAN,question30_severity:STRING,question30_cause:STRING,question31_experienced:BOOLEAN,question31_severity:STRING,question31_cause:STRING,question32_experienced:BOOLEAN,question32_severity:STRING,question32_cause:STRING,other_incidents_or_effects:STRING,neq_total_effects_experienced:INTEGER,neq_effects_due_to_treatment:INTEGER,neq_effects_due_to_other:INTEGER,neq_total_severity_score:INTEGER,neq_avg_severity_of_experienced_effects:FLOAT" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "mi_global_eval_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,cultivating_change_talk_score:INTEGER,cultivating_change_talk_reasoning:STRING,softening_sustain_talk_score:INTEGER,softening_sustain_talk_reasoning:STRING,partnership_score:INTEGER,partnership_reasoning:STRING,empathy_score:INTEGER,empathy_reasoning:STRING" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "mi_batch_behavior_eval_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,reasoning:STRING,GI:INTEGER,Persuade:INTEGER,Persuade_with:INTEGER,Q:INTEGER,SR:INTEGER,CR:INTEGER,AF:INTEGER,Seek:INTEGER,Emphasize:INTEGER,Confront:INTEGER,total_mi_adherent:INTEGER,total_mi_non_adherent:INTEGER,percent_mi_adherent:FLOAT,percent_cr:FLOAT,r_q_ratio:FLOAT" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "conversation_log" \
     "pairing_id:INTEGER,session_id:INTEGER,turn:INTEGER,speaker:STRING,message:STRING,session_conclusion:BOOLEAN,appraisal_internal_reflection:STRING,internal_justification:STRING,goal:STRING,strategy:STRING,tactic:STRING,hopelessness_intensity:FLOAT,negative_core_belief_intensity:FLOAT,cognitive_preoccupation_with_use_intensity:FLOAT,self_efficacy_intensity:FLOAT,distress_tolerance_intensity:FLOAT,substance_craving_intensity:FLOAT,motivational_intensity:FLOAT,ambivalence_about_change_intensity:FLOAT,perceived_burdensomeness_intensity:FLOAT,thwarted_belongingness_intensity:FLOAT" \
-    "session_id,turn" \
+    "pairing_id,session_id,turn" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "after_session_reports" \
     "pairing_id:INTEGER,session_id:INTEGER,journal_summary:STRING,state_change_justification:STRING,death_by_suicide_occurred:BOOLEAN,death_by_suicide_attribution:STRING,death_by_suicide_internal_justification:STRING,suicide_attempt_occurred:BOOLEAN,suicide_attempt_attribution:STRING,suicide_attempt_internal_justification:STRING,non_suicidal_self_injury_occurred:BOOLEAN,non_suicidal_self_injury_attribution:STRING,non_suicidal_self_injury_internal_justification:STRING,relapse_substance_use_occurred:BOOLEAN,relapse_substance_use_attribution:STRING,relapse_substance_use_internal_justification:STRING,increase_alcohol_seeking_occurred:BOOLEAN,increase_alcohol_seeking_attribution:STRING,increase_alcohol_seeking_internal_justification:STRING,neglect_of_roles_occurred:BOOLEAN,neglect_of_roles_attribution:STRING,neglect_of_roles_internal_justification:STRING,treatment_dropout_occurred:BOOLEAN,treatment_dropout_attribution:STRING,treatment_dropout_internal_justification:STRING,intensification_suicidal_ideation_occurred:BOOLEAN,intensification_suicidal_ideation_attribution:STRING,intensification_suicidal_ideation_internal_justification:STRING,intensification_shame_stigma_occurred:BOOLEAN,intensification_shame_stigma_attribution:STRING,intensification_shame_stigma_internal_justification:STRING,interpersonal_functioning_decline_occurred:BOOLEAN,interpersonal_functioning_decline_attribution:STRING,interpersonal_functioning_decline_internal_justification:STRING,hopelessness_intensity:INTEGER,negative_core_belief_intensity:INTEGER,cognitive_preoccupation_with_use_intensity:INTEGER,self_efficacy_intensity:INTEGER,distress_tolerance_intensity:INTEGER,substance_craving_intensity:INTEGER,motivational_intensity:INTEGER,ambivalence_about_change_intensity:INTEGER,perceived_burdensomeness_intensity:INTEGER,thwarted_belongingness_intensity:INTEGER" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
 load_table "action_plan_eval_logs" \
     "pairing_id:INTEGER,session_id:INTEGER,turn:INTEGER,assess:BOOLEAN,de_escalate:BOOLEAN,recommend_emergency_services:BOOLEAN,request_human_consultation:BOOLEAN,overall_justification:STRING" \
-    "session_id" \
+    "pairing_id,session_id" \
     "pairing_id,0,100000,100" \
     "append"
 
+# Build derived tables read by the dashboard
+echo ""
+echo "========================================"
+echo "Building Derived Tables"
+echo "========================================"
+
+# One row per NEQ answer so the question summary can GROUP BY question_number directly
+echo "Rebuilding neq_answers..."
+if bq query --use_legacy_sql=false "
+CREATE OR REPLACE TABLE \`$PROJECT_ID.$DATASET.neq_answers\`
+CLUSTER BY pairing_id, session_id
+AS
+SELECT
+    T.pairing_id,
+    T.session_id,
+    q.question_number,
+    q.experienced,
+    CASE q.severity
+        WHEN 'Not at all' THEN 0
+        WHEN 'Slightly' THEN 1
+        WHEN 'Moderately' THEN 2
+        WHEN 'Very' THEN 3
+        WHEN 'Extremely' THEN 4
+        ELSE NULL
+    END AS severity_value,
+    q.cause
+FROM \`$PROJECT_ID.$DATASET.survey_neq_logs\` AS T
+CROSS JOIN UNNEST([
+        STRUCT(1 AS question_number, question1_experienced AS experienced, question1_severity AS severity, question1_cause AS cause),
+        STRUCT(2 AS question_number, question2_experienced AS experienced, question2_severity AS severity, question2_cause AS cause),
+        STRUCT(3 AS question_number, question3_experienced AS experienced, question3_severity AS severity, question3_cause AS cause),
+        STRUCT(4 AS question_number, question4_experienced AS experienced, question4_severity AS severity, question4_cause AS cause),
+        STRUCT(5 AS question_number, question5_experienced AS experienced, question5_severity AS severity, question5_cause AS cause),
+        STRUCT(6 AS question_number, question6_experienced AS experienced, question6_severity AS severity, question6_cause AS cause),
+        STRUCT(7 AS question_number, question7_experienced AS experienced, question7_severity AS severity, question7_cause AS cause),
+        STRUCT(8 AS question_number, question8_experienced AS experienced, question8_severity AS severity, question8_cause AS cause),
+        STRUCT(9 AS question_number, question9_experienced AS experienced, question9_severity AS severity, question9_cause AS cause),
+        STRUCT(10 AS question_number, question10_experienced AS experienced, question10_severity AS severity, question10_cause AS cause),
+        STRUCT(11 AS question_number, question11_experienced AS experienced, question11_severity AS severity, question11_cause AS cause),
+        STRUCT(12 AS question_number, question12_experienced AS experienced, question12_severity AS severity, question12_cause AS cause),
+        STRUCT(13 AS question_number, question13_experienced AS experienced, question13_severity AS severity, question13_cause AS cause),
+        STRUCT(14 AS question_number, question14_experienced AS experienced, question14_severity AS severity, question14_cause AS cause),
+        STRUCT(15 AS question_number, question15_experienced AS experienced, question15_severity AS severity, question15_cause AS cause),
+        STRUCT(16 AS question_number, question16_experienced AS experienced, question16_severity AS severity, question16_cause AS cause),
+        STRUCT(17 AS question_number, question17_experienced AS experienced, question17_severity AS severity, question17_cause AS cause),
+        STRUCT(18 AS question_number, question18_experienced AS experienced, question18_severity AS severity, question18_cause AS cause),
+        STRUCT(19 AS question_number, question19_experienced AS experienced, question19_severity AS severity, question19_cause AS cause),
+        STRUCT(20 AS question_number, question20_experienced AS experienced, question20_severity AS severity, question20_cause AS cause),
+        STRUCT(21 AS question_number, question21_experienced AS experienced, question21_severity AS severity, question21_cause AS cause),
+        STRUCT(22 AS question_number, question22_experienced AS experienced, question22_severity AS severity, question22_cause AS cause),
+        STRUCT(23 AS question_number, question23_experienced AS experienced, question23_severity AS severity, question23_cause AS cause),
+        STRUCT(24 AS question_number, question24_experienced AS experienced, question24_severity AS severity, question24_cause AS cause),
+        STRUCT(25 AS question_number, question25_experienced AS experienced, question25_severity AS severity, question25_cause AS cause),
+        STRUCT(26 AS question_number, question26_experienced AS experienced, question26_severity AS severity, question26_cause AS cause),
+        STRUCT(27 AS question_number, question27_experienced AS experienced, question27_severity AS severity, question27_cause AS cause),
+        STRUCT(28 AS question_number, question28_experienced AS experienced, question28_severity AS severity, question28_cause AS cause),
+        STRUCT(29 AS question_number, question29_experienced AS experienced, question29_severity AS severity, question29_cause AS cause),
+        STRUCT(30 AS question_number, question30_experienced AS experienced, question30_severity AS severity, question30_cause AS cause),
+        STRUCT(31 AS question_number, question31_experienced AS experienced, question31_severity AS severity, question31_cause AS cause),
+        STRUCT(32 AS question_number, question32_experienced AS experienced, question32_severity AS severity, question32_cause AS cause)
+]) AS q
+"; then
+    echo "✓ Rebuilt neq_answers"
+else
+    echo "✗ Failed to rebuild neq_answers"
+fi
+
+# Per-metric sums by therapist/subtype/state/session for the comparison endpoints.
+# Schedule this statement as a nightly BigQuery scheduled query to keep it current between uploads.
+echo "Rebuilding session_rollup..."
+if bq query --use_legacy_sql=false "
+CREATE OR REPLACE TABLE \`$PROJECT_ID.$DATASET.session_rollup\`
+CLUSTER BY therapist_id, subtype_name
+AS
+SELECT
+    grouped.therapist_id,
+    grouped.subtype_name,
+    grouped.state_of_change,
+    grouped.session_id,
+    m.metric,
+    m.value_sum,
+    m.value_count,
+    grouped.session_count
+FROM (
+    SELECT sf.therapist_id, sf.subtype_name, sf.state_of_change, sf.session_id,
+        COUNT(DISTINCT FORMAT('%d#%d', T.pairing_id, T.session_id)) AS session_count,
+        [
+            STRUCT('sure.total_sure_score' AS metric, SUM(CAST(T.total_sure_score AS FLOAT64)) AS value_sum, COUNT(T.total_sure_score) AS value_count),
+            STRUCT('sure.total_sure_drug_use' AS metric, SUM(CAST(T.total_sure_drug_use AS FLOAT64)) AS value_sum, COUNT(T.total_sure_drug_use) AS value_count),
+            STRUCT('sure.total_sure_self_care' AS metric, SUM(CAST(T.total_sure_self_care AS FLOAT64)) AS value_sum, COUNT(T.total_sure_self_care) AS value_count),
+            STRUCT('sure.total_sure_relationships' AS metric, SUM(CAST(T.total_sure_relationships AS FLOAT64)) AS value_sum, COUNT(T.total_sure_relationships) AS value_count),
+            STRUCT('sure.total_sure_material_resources' AS metric, SUM(CAST(T.total_sure_material_resources AS FLOAT64)) AS value_sum, COUNT(T.total_sure_material_resources) AS value_count),
+            STRUCT('sure.total_sure_outlook' AS metric, SUM(CAST(T.total_sure_outlook AS FLOAT64)) AS value_sum, COUNT(T.total_sure_outlook) AS value_count)
+        ] AS metrics
+    FROM \`$PROJECT_ID.$DATASET.session_facts\` AS sf
+    JOIN \`$PROJECT_ID.$DATASET.survey_sure_logs\` AS T
+        ON sf.pairing_id = T.pairing_id AND sf.session_id = T.session_id
+    GROUP BY 1, 2, 3, 4
+    UNION ALL
+    SELECT sf.therapist_id, sf.subtype_name, sf.state_of_change, sf.session_id,
+        COUNT(DISTINCT FORMAT('%d#%d', T.pairing_id, T.session_id)) AS session_count,
+        [
+            STRUCT('mi_global.cultivating_change_talk_score' AS metric, SUM(CAST(T.cultivating_change_talk_score AS FLOAT64)) AS value_sum, COUNT(T.cultivating_change_talk_score) AS value_count),
+            STRUCT('mi_global.softening_sustain_talk_score' AS metric, SUM(CAST(T.softening_sustain_talk_score AS FLOAT64)) AS value_sum, COUNT(T.softening_sustain_talk_score) AS value_count),
+            STRUCT('mi_global.partnership_score' AS metric, SUM(CAST(T.partnership_score AS FLOAT64)) AS value_sum, COUNT(T.partnership_score) AS value_count),
+            STRUCT('mi_global.empathy_score' AS metric, SUM(CAST(T.empathy_score AS FLOAT64)) AS value_sum, COUNT(T.empathy_score) AS value_count)
+        ] AS metrics
+    FROM \`$PROJECT_ID.$DATASET.session_facts\` AS sf
+    JOIN \`$PROJECT_ID.$DATASET.mi_global_eval_logs\` AS T
+        ON sf.pairing_id = T.pairing_id AND sf.session_id = T.session_id
+    GROUP BY 1, 2, 3, 4
+    UNION ALL
+    SELECT sf.therapist_id, sf.subtype_name, sf.state_of_change, sf.session_id,
+        COUNT(DISTINCT FORMAT('%d#%d', T.pairing_id, T.session_id)) AS session_count,
+        [
+            STRUCT('mi_behavior.percent_cr' AS metric, SUM(CAST(T.percent_cr AS FLOAT64)) AS value_sum, COUNT(T.percent_cr) AS value_count),
+            STRUCT('mi_behavior.r_q_ratio' AS metric, SUM(CAST(T.r_q_ratio AS FLOAT64)) AS value_sum, COUNT(T.r_q_ratio) AS value_count),
+            STRUCT('mi_behavior.percent_mi_adherent' AS metric, SUM(CAST(T.percent_mi_adherent AS FLOAT64)) AS value_sum, COUNT(T.percent_mi_adherent) AS value_count)
+        ] AS metrics
+    FROM \`$PROJECT_ID.$DATASET.session_facts\` AS sf
+    JOIN \`$PROJECT_ID.$DATASET.mi_batch_behavior_eval_logs\` AS T
+        ON sf.pairing_id = T.pairing_id AND sf.session_id = T.session_id
+    GROUP BY 1, 2, 3, 4
+    UNION ALL
+    SELECT sf.therapist_id, sf.subtype_name, sf.state_of_change, sf.session_id,
+        COUNT(DISTINCT FORMAT('%d#%d', T.pairing_id, T.session_id)) AS session_count,
+        [
+            STRUCT('srs.overall' AS metric, SUM(CAST(T.overall AS FLOAT64)) AS value_sum, COUNT(T.overall) AS value_count),
+            STRUCT('srs.relationship' AS metric, SUM(CAST(T.relationship AS FLOAT64)) AS value_sum, COUNT(T.relationship) AS value_count),
+            STRUCT('srs.goals_and_topics' AS metric, SUM(CAST(T.goals_and_topics AS FLOAT64)) AS value_sum, COUNT(T.goals_and_topics) AS value_count),
+            STRUCT('srs.approach_or_method' AS metric, SUM(CAST(T.approach_or_method AS FLOAT64)) AS value_sum, COUNT(T.approach_or_method) AS value_count)
+        ] AS metrics
+    FROM \`$PROJECT_ID.$DATASET.session_facts\` AS sf
+    JOIN \`$PROJECT_ID.$DATASET.survey_srs_logs\` AS T
+        ON sf.pairing_id = T.pairing_id AND sf.session_id = T.session_id
+    GROUP BY 1, 2, 3, 4
+) AS grouped
+CROSS JOIN UNNEST(grouped.metrics) AS m
+"; then
+    echo "✓ Rebuilt session_rollup"
+else
+    echo "✗ Failed to rebuild session_rollup"
+fi
+
+# One row per session with an any-harm flag and one flag per adverse event type
+echo "Rebuilding session_harm..."
+if bq query --use_legacy_sql=false "
+CREATE OR REPLACE TABLE \`$PROJECT_ID.$DATASET.session_harm\`
+CLUSTER BY pairing_id, session_id
+AS
+SELECT
+    pairing_id,
+    session_id,
+    MAX(IF(event_type = 'death_by_suicide' AND occurred, 1, 0)) AS death_by_suicide,
+    MAX(IF(event_type = 'suicide_attempt' AND occurred, 1, 0)) AS suicide_attempt,
+    MAX(IF(event_type = 'non_suicidal_self_injury' AND occurred, 1, 0)) AS non_suicidal_self_injury,
+    MAX(IF(event_type = 'relapse_substance_use' AND occurred, 1, 0)) AS relapse_substance_use,
+    MAX(IF(event_type = 'increase_alcohol_seeking' AND occurred, 1, 0)) AS increase_alcohol_seeking,
+    MAX(IF(event_type = 'neglect_of_roles' AND occurred, 1, 0)) AS neglect_of_roles,
+    MAX(IF(event_type = 'treatment_dropout' AND occurred, 1, 0)) AS treatment_dropout,
+    MAX(IF(event_type = 'intensification_suicidal_ideation' AND occurred, 1, 0)) AS intensification_suicidal_ideation,
+    MAX(IF(event_type = 'intensification_shame_stigma' AND occurred, 1, 0)) AS intensification_shame_stigma,
+    MAX(IF(event_type = 'interpersonal_functioning_decline' AND occurred, 1, 0)) AS interpersonal_functioning_decline,
+    MAX(IF(occurred, 1, 0)) AS harm_flag
+FROM \`$PROJECT_ID.$DATASET.adverse_events\`
+WHERE pairing_id IS NOT NULL AND session_id IS NOT NULL
+GROUP BY pairing_id, session_id
+"; then
+    echo "✓ Rebuilt session_harm"
+else
+    echo "✗ Failed to rebuild session_harm"
+fi
+
 echo ""
 echo "=========================================="
 echo "Upload Complete!"